@@ -9,10 +9,12 @@ from .interfaces import ICodeAnalyzer, IFixGenerator, ITestRunner, IPRManager
 from .exceptions import AnalysisError, FixGenerationError, TestFailureError, PRCreationError
 from .config import Config
 from .utils import FileUtils, GitUtils, LLMUtils
+from .workflow_dag import WorkflowDAG, SharedState
 
 __all__ = [
     'BaseAnalyzer', 'BaseAgent', 'BaseTool',
     'ICodeAnalyzer', 'IFixGenerator', 'ITestRunner', 'IPRManager',
     'AnalysisError', 'FixGenerationError', 'TestFailureError', 'PRCreationError',
-    'Config', 'FileUtils', 'GitUtils', 'LLMUtils'
+    'Config', 'FileUtils', 'GitUtils', 'LLMUtils',
+    'WorkflowDAG', 'SharedState'
 ]
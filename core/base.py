@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 @dataclass
@@ -14,6 +14,11 @@ class AnalysisResult:
     issues: List[Dict[str, Any]]
     recommendations: List[str]
     metadata: Dict[str, Any] = None
+    # Precomputed so consumers never re-count (or consume) the issues
+    issues_count: int = field(init=False)
+
+    def __post_init__(self):
+        self.issues_count = len(self.issues)
 
 @dataclass
 class FixResult:
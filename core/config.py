@@ -1,6 +1,7 @@
 """Configuration management for the code analyzer"""
 
 import os
+from functools import cached_property
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
@@ -42,6 +43,12 @@ class Config:
         """Create config from dictionary"""
         return cls(**{k: v for k, v in config_dict.items() if hasattr(cls, k)})
     
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Dict form built once and reused; workflows created per file in a
+        batch read this instead of rebuilding the dict each time"""
+        return self.to_dict()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary"""
         return {
@@ -0,0 +1,105 @@
+"""Simple DAG scheduler for workflow stages"""
+
+import copy
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class SharedState:
+    """Cross-workflow cache for memoized node outputs"""
+
+    _MAX_ENTRIES = 512
+
+    def __init__(self):
+        self._memo: Dict[Any, Any] = {}
+
+    def get(self, key: Any) -> Any:
+        return self._memo.get(key)
+
+    def set(self, key: Any, value: Any) -> None:
+        self._memo[key] = value
+        while len(self._memo) > self._MAX_ENTRIES:
+            del self._memo[next(iter(self._memo))]
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+def file_stat_key(context: Dict[str, Any]) -> Tuple[str, int, int]:
+    """Memo key for file-based nodes: invalidates when the file changes"""
+    stat = os.stat(context['file_path'])
+    return (context['file_path'], stat.st_mtime_ns, stat.st_size)
+
+class WorkflowDAG:
+    """Runs named workflow stages in dependency order
+
+    Nodes are callables that receive the shared context dict; their return
+    value is stored in the context under the node name. A node can set
+    context['done'] = True to short-circuit the remaining stages. Nodes
+    registered with a memo_key function cache their output in the shared
+    state so other workflows (or reruns on unchanged files) reuse it.
+    """
+
+    def __init__(self, state: SharedState = None):
+        self.nodes: Dict[str, Callable] = {}
+        self.edges: List[Tuple[str, str]] = []
+        self.state = state or SharedState()
+        self._memo_keys: Dict[str, Callable] = {}
+
+    def add_node(self, name: str, func: Callable, memo_key: Optional[Callable] = None) -> None:
+        """Register a stage; memo_key enables shared-state caching"""
+        self.nodes[name] = func
+        if memo_key is not None:
+            self._memo_keys[name] = memo_key
+
+    def add_edge(self, upstream: str, downstream: str) -> None:
+        """Declare that downstream depends on upstream"""
+        self.edges.append((upstream, downstream))
+
+    def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute all stages in topological order against the context"""
+        for name in self._topological_order():
+            if context.get('done'):
+                break
+            context[name] = self._run_node(name, context)
+        return context
+
+    def _run_node(self, name: str, context: Dict[str, Any]) -> Any:
+        memo_key = self._memo_keys.get(name)
+        if memo_key is None:
+            return self.nodes[name](context)
+
+        key = (name, memo_key(context))
+        cached = self.state.get(key)
+        if cached is None:
+            cached = self.nodes[name](context)
+            self.state.set(key, cached)
+        # Copy so callers mutating the result don't poison the cache
+        return copy.deepcopy(cached)
+
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm; nodes without edges keep insertion order"""
+        in_degree = {name: 0 for name in self.nodes}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+
+        for upstream, downstream in self.edges:
+            in_degree[downstream] += 1
+            dependents[upstream].append(downstream)
+
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        order = []
+
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for downstream in dependents[name]:
+                in_degree[downstream] -= 1
+                if in_degree[downstream] == 0:
+                    ready.append(downstream)
+
+        if len(order) != len(self.nodes):
+            raise ValueError("Workflow DAG contains a cycle")
+
+        return order
+
+# Shared across workflow instances so e.g. AutoFixWorkflow and
+# StrandsWorkflow running on the same unchanged file analyze it once
+shared_state = SharedState()
@@ -6,9 +6,11 @@ Combines Strands Agents coordination with the existing auto-fix workflow.
 """
 
 import argparse
+import asyncio
 import sys
-import json
+import threading
 from pathlib import Path
+from smart_code_analyzer import json_dumps
 from strands_code_analyzer import StrandsCodeAnalyzer
 from auto_fix_pr import AutoFixWorkflow
 
@@ -18,6 +20,9 @@ class StrandsAutoFixCLI:
     def __init__(self):
         self.strands_analyzer = StrandsCodeAnalyzer()
         self.auto_fix_workflow = AutoFixWorkflow()
+        # The auto-fix workflow checks out branches and commits on the one
+        # shared working tree - batch workers must take turns through it
+        self._git_lock = threading.Lock()
     
     def run_strands_workflow(self, file_path: str, mode: str = "full") -> dict:
         """Run Strands-coordinated workflow"""
@@ -27,19 +32,20 @@ class StrandsAutoFixCLI:
         
         if mode == "analysis_only":
             # Use Strands agents for analysis only
-            return self.strands_analyzer.analyze_with_agents(file_path)
+            return asyncio.run(self.strands_analyzer.analyze_with_agents(file_path))
         
         elif mode == "coordinated":
             # Use Strands for coordination, existing system for execution
             print("🎯 Using Strands agents for workflow coordination...")
             
             # Step 1: Strands analysis
-            strands_results = self.strands_analyzer.analyze_with_agents(file_path)
+            strands_results = asyncio.run(self.strands_analyzer.analyze_with_agents(file_path))
             
             # Step 2: If Strands analysis is successful, use existing auto-fix for PR creation
             if strands_results['final_results']['workflow_success']:
                 print("\n🔄 Executing auto-fix workflow with real PR creation...")
-                auto_fix_results = self.auto_fix_workflow.run_auto_fix_workflow(file_path)
+                with self._git_lock:
+                    auto_fix_results = self.auto_fix_workflow.run_auto_fix_workflow(file_path)
                 
                 # Combine results
                 combined_results = {
@@ -54,8 +60,30 @@ class StrandsAutoFixCLI:
         
         else:  # full mode
             # Use existing auto-fix workflow enhanced with Strands coordination
-            return self.auto_fix_workflow.run_auto_fix_workflow(file_path)
+            with self._git_lock:
+                return self.auto_fix_workflow.run_auto_fix_workflow(file_path)
     
+    def run_batch(self, file_paths: list, mode: str = "full", parallel: int = 4) -> list:
+        """Run the workflow over multiple files with bounded concurrency
+
+        Concurrency is capped with a semaphore so we stay under the Bedrock
+        requests-per-minute ceiling. Results come back in input order.
+        Only the analysis stages overlap; the git/PR tail of coordinated
+        and full modes is serialized behind a lock because it mutates the
+        shared working tree.
+        """
+
+        async def _run():
+            sem = asyncio.Semaphore(max(1, parallel))
+
+            async def one(path):
+                async with sem:
+                    return await asyncio.to_thread(self.run_strands_workflow, path, mode)
+
+            return await asyncio.gather(*[one(p) for p in file_paths])
+
+        return asyncio.run(_run())
+
     def print_results_summary(self, results: dict, mode: str):
         """Print formatted results summary"""
         
@@ -66,7 +94,7 @@ class StrandsAutoFixCLI:
             print(f"   Quality Score: {final['analysis']['quality_score']}/10")
             print(f"   Issues Found: {final['analysis']['total_issues']}")
             print(f"   Fixes Available: {final['fixes']['fixes_applied']}")
-            print(f"   Agent Interactions: {len(results['agent_interactions'])}")
+            print(f"   Agent Interactions: {len(results['agent_interactions']['agent'])}")
         
         elif mode == "coordinated":
             if 'auto_fix_execution' in results:
@@ -105,37 +133,45 @@ Examples:
         """
     )
     
-    parser.add_argument("file", help="Python file to analyze and fix")
-    parser.add_argument("--mode", choices=["analysis_only", "coordinated", "full"], 
+    parser.add_argument("files", nargs='+', help="Python file(s) to analyze and fix")
+    parser.add_argument("--mode", choices=["analysis_only", "coordinated", "full"],
                        default="full", help="Workflow mode")
+    parser.add_argument("--parallel", "-p", type=int, default=4,
+                       help="Max files analyzed concurrently in batch mode")
     parser.add_argument("--output", "-o", help="Save results to JSON file")
     parser.add_argument("--summary", "-s", help="Save agent summary to markdown file")
-    
+
     args = parser.parse_args()
-    
-    # Validate file
-    if not Path(args.file).exists():
-        print(f"❌ File not found: {args.file}")
-        sys.exit(1)
-    
-    if not args.file.endswith('.py'):
-        print(f"❌ Only Python files are currently supported")
-        sys.exit(1)
-    
+
+    # Validate files
+    for file_path in args.files:
+        if not Path(file_path).exists():
+            print(f"❌ File not found: {file_path}")
+            sys.exit(1)
+
+        if not file_path.endswith('.py'):
+            print(f"❌ Only Python files are currently supported")
+            sys.exit(1)
+
     try:
         # Initialize CLI
         cli = StrandsAutoFixCLI()
-        
-        # Run workflow
-        results = cli.run_strands_workflow(args.file, args.mode)
-        
-        # Print summary
-        cli.print_results_summary(results, args.mode)
+
+        # Run workflow (fan out when more than one file is given)
+        if len(args.files) > 1:
+            batch_results = cli.run_batch(args.files, args.mode, args.parallel)
+            results = dict(zip(args.files, batch_results))
+            for file_path, file_results in results.items():
+                print(f"\n📁 {file_path}")
+                cli.print_results_summary(file_results, args.mode)
+        else:
+            results = cli.run_strands_workflow(args.files[0], args.mode)
+            cli.print_results_summary(results, args.mode)
         
         # Save results if requested
         if args.output:
             with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2)
+                f.write(json_dumps(results, indent=True))
             print(f"\n💾 Results saved to: {args.output}")
         
         # Save agent summary if requested and available
@@ -5,97 +5,254 @@ Strands-Powered Code Analyzer
 Uses Strands Agents for coordinated code analysis, fix generation, and PR workflow.
 """
 
+import ast
+import asyncio
+import copy
+import functools
+import mmap
 import os
 import json
+import queue
+import re
 import subprocess
+import threading
+import zlib
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
+# Optional: orjson serializes the large result reports 3-10x faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dump_results(results: Dict[str, Any], file_path: str) -> None:
+    """Write a results dict as indented JSON, via orjson when available"""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(results, f, indent=2)
+
+# Background artifact writer - serializing reports on a daemon thread lets
+# the workflow keep running while the files are written
+_writer_queue: queue.Queue = queue.Queue()
+_writer_thread = None
+
+def _writer_loop() -> None:
+    while True:
+        task = _writer_queue.get()
+        try:
+            task()
+        except Exception as e:
+            print(f"⚠️  Background write failed: {e}")
+        finally:
+            _writer_queue.task_done()
+
+def submit_artifact_write(task) -> None:
+    """Queue a write callable for the background writer thread"""
+    global _writer_thread
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_writer_loop, daemon=True)
+        _writer_thread.start()
+    _writer_queue.put(task)
+
+def flush_artifact_writes() -> None:
+    """Block until every queued artifact write has finished"""
+    _writer_queue.join()
+
+# Issue patterns compiled once at import - one alternation sweep finds every
+# issue kind in a single pass over the content
+_ISSUE_RE = re.compile(r'(?P<eval>\beval\()|(?P<badnone>!=\s*None\b)|(?P<open>\bopen\()')
+_WITH_RE = re.compile(r'\bwith\s')
+
+# One pattern drives every rewrite in generate_code_fixes so the content is
+# copied once instead of once per fix kind
+_FIX_RE = re.compile(r'\beval\(|!=\s*None\b')
+
+def _fix_replacement(m: 're.Match') -> str:
+    return 'ast.literal_eval(' if m.group().endswith('(') else 'is not None'
+
+# Parsed ASTs cached by content so analysis, fix generation and test
+# validation share one parse per source revision
+@functools.lru_cache(maxsize=256)
+def _parse_ast(content: str) -> Optional[ast.AST]:
+    """Parse content once; returns None (and caches it) when unparseable"""
+    try:
+        return ast.parse(content)
+    except SyntaxError:
+        return None
+
 # Import Strands framework (using conceptual implementation for now)
 class MockAgent:
     """Mock Strands Agent for demonstration"""
+
+    # Frozen keyword table shared by all agents - built once at class load
+    _TOOL_KEYWORDS = MappingProxyType({
+        'analyze_code_quality': ('analyze', 'quality', 'issues', 'review'),
+        'generate_code_fixes': ('fix', 'improve', 'repair', 'correct'),
+        'run_tests': ('test', 'validate', 'check', 'verify'),
+        'create_pull_request': ('pr', 'pull request', 'merge', 'commit'),
+        'coordinate_workflow': ('coordinate', 'orchestrate', 'manage', 'workflow')
+    })
+
     def __init__(self, name: str, system_prompt: str, tools: List = None):
         self.name = name
         self.system_prompt = system_prompt
         self.tools = tools or []
         self.tool_registry = {tool.__name__: tool for tool in self.tools if hasattr(tool, '__name__')}
-    
+
+        # Inverted keyword index built once at construction: a single
+        # alternation pass over the prompt finds every keyword hit instead
+        # of rescanning the prompt per tool per keyword
+        self._keyword_to_tool = {}
+        for tool_name in self.tool_registry:
+            for keyword in self._TOOL_KEYWORDS.get(tool_name, ()):
+                self._keyword_to_tool.setdefault(keyword, tool_name)
+        self._keyword_re = re.compile(
+            '|'.join(re.escape(kw) for kw in sorted(self._keyword_to_tool, key=len, reverse=True))
+        ) if self._keyword_to_tool else None
+
     def __call__(self, prompt: str) -> str:
         # Simulate agent processing with tool routing
-        for tool_name, tool_func in self.tool_registry.items():
-            if self._should_use_tool(prompt, tool_name):
-                try:
-                    result = self._call_tool_with_prompt(tool_func, prompt)
-                    return f"[{self.name}] {result}"
-                except Exception as e:
-                    return f"[{self.name}] Tool error: {e}"
+        tool_name = self._route_tool(prompt.lower())
+        if tool_name is not None:
+            try:
+                result = self._call_tool_with_prompt(self.tool_registry[tool_name], prompt)
+                return f"[{self.name}] {result}"
+            except Exception as e:
+                return f"[{self.name}] Tool error: {e}"
         return f"[{self.name}] Analyzed: {prompt[:100]}..."
-    
-    def _should_use_tool(self, prompt: str, tool_name: str) -> bool:
-        prompt_lower = prompt.lower()
-        tool_keywords = {
-            'analyze_code_quality': ['analyze', 'quality', 'issues', 'review'],
-            'generate_code_fixes': ['fix', 'improve', 'repair', 'correct'],
-            'run_tests': ['test', 'validate', 'check', 'verify'],
-            'create_pull_request': ['pr', 'pull request', 'merge', 'commit'],
-            'coordinate_workflow': ['coordinate', 'orchestrate', 'manage', 'workflow']
-        }
-        keywords = tool_keywords.get(tool_name, [])
-        return any(keyword in prompt_lower for keyword in keywords)
-    
+
+    def _route_tool(self, lowered: str) -> Optional[str]:
+        """Pick the first registered tool with a keyword hit in the prompt"""
+        if self._keyword_re is None:
+            return None
+        hits = {self._keyword_to_tool[m.group()] for m in self._keyword_re.finditer(lowered)}
+        for tool_name in self.tool_registry:
+            if tool_name in hits:
+                return tool_name
+        return None
+
+    # Per-tool argument adapters, built once at class scope - dispatch is a
+    # dict lookup instead of a chain of __name__ comparisons per invocation
+    _TOOL_ADAPTERS = MappingProxyType({
+        'analyze_code_quality': lambda tool, prompt: tool(prompt),
+        'generate_code_fixes': lambda tool, prompt: tool(prompt, []),  # Mock issues list
+        'run_tests': lambda tool, prompt: tool("temp_file.py"),
+        'create_pull_request': lambda tool, prompt: tool("feature-branch", "Fix issues", "Automated fixes")
+    })
+
     def _call_tool_with_prompt(self, tool_func, prompt):
-        if tool_func.__name__ == 'analyze_code_quality':
-            return tool_func(prompt)
-        elif tool_func.__name__ == 'generate_code_fixes':
-            return tool_func(prompt, [])  # Mock issues list
-        elif tool_func.__name__ == 'run_tests':
-            return tool_func("temp_file.py")
-        elif tool_func.__name__ == 'create_pull_request':
-            return tool_func("feature-branch", "Fix issues", "Automated fixes")
-        else:
-            return tool_func(prompt)
+        adapter = self._TOOL_ADAPTERS.get(tool_func.__name__, lambda tool, prompt: tool(prompt))
+        return adapter(tool_func, prompt)
 
 def mock_tool(func):
     """Mock tool decorator"""
     func._is_tool = True
     return func
 
+def _scan_issues_ast(tree: ast.AST):
+    """Find issue positions in a single ast.walk"""
+    eval_line = None
+    open_line = None
+    bad_none_line = None
+    has_with = False
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            if node.func.id == 'eval' and eval_line is None:
+                eval_line = node.lineno
+            elif node.func.id == 'open' and open_line is None:
+                open_line = node.lineno
+        elif isinstance(node, ast.Compare):
+            if bad_none_line is None and any(
+                isinstance(op, ast.NotEq) and isinstance(comp, ast.Constant) and comp.value is None
+                for op, comp in zip(node.ops, node.comparators)
+            ):
+                bad_none_line = node.lineno
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            has_with = True
+
+    return eval_line, open_line, bad_none_line, has_with
+
+def _scan_issues_text(file_content: str):
+    """Regex fallback scan for content that doesn't parse
+
+    Only the first hit per pattern matters, so the sweep stops as soon as
+    all three are recorded instead of visiting every remaining match.
+    """
+    eval_line = None
+    open_line = None
+    bad_none_line = None
+
+    for m in _ISSUE_RE.finditer(file_content):
+        kind = m.lastgroup
+        if kind == 'eval' and eval_line is None:
+            eval_line = file_content.count('\n', 0, m.start()) + 1
+        elif kind == 'open' and open_line is None:
+            open_line = file_content.count('\n', 0, m.start()) + 1
+        elif kind == 'badnone' and bad_none_line is None:
+            bad_none_line = file_content.count('\n', 0, m.start()) + 1
+        if eval_line is not None and open_line is not None and bad_none_line is not None:
+            break
+
+    has_with = _WITH_RE.search(file_content) is not None
+    return eval_line, open_line, bad_none_line, has_with
+
 # Strands Tools for Code Analysis
 @mock_tool
 def analyze_code_quality(file_content: str) -> Dict[str, Any]:
     """Analyze code quality and identify issues"""
-    
-    # Simulate comprehensive analysis
+    # Copy so callers mutating the result don't poison the cache
+    return copy.deepcopy(_analyze_code_quality_impl(file_content))
+
+# The tool is called several times per workflow (agent routing, the explicit
+# analysis step, and the testing agent) with identical content - memoize by
+# the content string so repeats are dict lookups
+@functools.lru_cache(maxsize=512)
+def _analyze_code_quality_impl(file_content: str) -> Dict[str, Any]:
+
+    # Prefer one ast.walk over the cached tree - real nodes only (no hits
+    # inside strings/comments) with exact line numbers; unparseable content
+    # falls back to the regex sweep
+    tree = _parse_ast(file_content)
+    if tree is not None:
+        eval_line, open_line, bad_none_line, has_with = _scan_issues_ast(tree)
+    else:
+        eval_line, open_line, bad_none_line, has_with = _scan_issues_text(file_content)
+
     issues = []
     quality_score = 7
-    
-    # Check for common issues
-    if 'eval(' in file_content:
+
+    if eval_line is not None:
         issues.append({
             'type': 'security',
             'severity': 'high',
             'description': 'Use of eval() with potential user input',
-            'line': file_content.split('\n').index([line for line in file_content.split('\n') if 'eval(' in line][0]) + 1 if any('eval(' in line for line in file_content.split('\n')) else 0
+            'line': eval_line
         })
         quality_score -= 2
-    
-    if 'open(' in file_content and 'with ' not in file_content:
+
+    if open_line is not None and not has_with:
         issues.append({
             'type': 'resource',
-            'severity': 'medium', 
+            'severity': 'medium',
             'description': 'File opened without context manager',
-            'line': 0
+            'line': open_line
         })
         quality_score -= 1
-    
-    if '!= None' in file_content:
+
+    if bad_none_line is not None:
         issues.append({
             'type': 'style',
             'severity': 'low',
             'description': 'Use "is not None" instead of "!= None"',
-            'line': 0
+            'line': bad_none_line
         })
-    
+
     return {
         'quality_score': max(1, quality_score),
         'issues': issues,
@@ -111,23 +268,37 @@ def analyze_code_quality(file_content: str) -> Dict[str, Any]:
 def generate_code_fixes(file_content: str, issues: List[Dict]) -> Dict[str, Any]:
     """Generate specific code fixes for identified issues"""
     
+    # Detection reuses the shared (cached-AST or regex) scan; the rewrite is
+    # a single substitution pass with a dispatch function
+    tree = _parse_ast(file_content)
+    if tree is not None:
+        eval_line, open_line, bad_none_line, has_with = _scan_issues_ast(tree)
+    else:
+        eval_line, open_line, bad_none_line, has_with = _scan_issues_text(file_content)
+
+    has_eval = eval_line is not None
+    has_open = open_line is not None
+    has_bad_none = bad_none_line is not None
+
+    if has_eval or has_bad_none:
+        fixed_content = _FIX_RE.sub(_fix_replacement, file_content)
+    else:
+        fixed_content = file_content
+
     fixes = []
-    fixed_content = file_content
-    
-    # Generate fixes based on common patterns
-    if 'eval(' in file_content:
+
+    if has_eval:
         fixes.append({
             'issue': 'Security: eval() usage',
             'original': 'eval(',
             'replacement': 'ast.literal_eval(',
             'explanation': 'Replace eval() with safer ast.literal_eval()'
         })
-        fixed_content = fixed_content.replace('eval(', 'ast.literal_eval(')
-        # Add import if needed
+        # Add import if needed - build the final string in one join
         if 'import ast' not in fixed_content:
-            fixed_content = 'import ast\n' + fixed_content
-    
-    if 'open(' in file_content and 'with ' not in file_content:
+            fixed_content = ''.join(['import ast\n', fixed_content])
+
+    if has_open and not has_with:
         # This is a simplified fix - in practice would use AST manipulation
         fixes.append({
             'issue': 'Resource management: unclosed file',
@@ -135,16 +306,15 @@ def generate_code_fixes(file_content: str, issues: List[Dict]) -> Dict[str, Any]
             'replacement': 'with open(',
             'explanation': 'Use context manager for proper file handling'
         })
-    
-    if '!= None' in file_content:
+
+    if has_bad_none:
         fixes.append({
             'issue': 'Style: None comparison',
             'original': '!= None',
             'replacement': 'is not None',
             'explanation': 'Use "is not None" for None comparisons'
         })
-        fixed_content = fixed_content.replace('!= None', 'is not None')
-    
+
     return {
         'fixes_applied': len(fixes),
         'fixes': fixes,
@@ -153,31 +323,40 @@ def generate_code_fixes(file_content: str, issues: List[Dict]) -> Dict[str, Any]
     }
 
 @mock_tool
-def run_tests(file_path: str) -> Dict[str, Any]:
-    """Run comprehensive tests on code"""
-    
+def run_tests(file_path: str, source: Optional[str] = None) -> Dict[str, Any]:
+    """Run comprehensive tests on code
+
+    Pass source to validate code already in memory without a disk
+    round trip; file_path then only labels error messages.
+    """
+
     results = {
         'syntax_check': True,
         'import_test': True,
         'static_analysis': {'passed': True, 'issues': []},
         'overall_status': 'passed'
     }
-    
-    # Try syntax check
-    try:
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                code = f.read()
-            compile(code, file_path, 'exec')
-            results['syntax_check'] = True
-        else:
+
+    code = source
+    if code is None:
+        if not os.path.exists(file_path):
             results['syntax_check'] = False
             results['overall_status'] = 'failed'
+            return results
+        with open(file_path, 'r') as f:
+            code = f.read()
+
+    # Try syntax check - a cached parse from the analysis step already
+    # proves the syntax is valid, so re-compiling is only needed on miss
+    try:
+        if _parse_ast(code) is None:
+            compile(code, file_path, 'exec')  # raises with the real error
+        results['syntax_check'] = True
     except SyntaxError as e:
         results['syntax_check'] = False
         results['syntax_error'] = str(e)
         results['overall_status'] = 'failed'
-    
+
     return results
 
 @mock_tool
@@ -185,8 +364,9 @@ def create_pull_request(branch_name: str, title: str, description: str) -> Dict[
     """Create pull request with fixes"""
     
     try:
-        # Simulate PR creation
-        pr_url = f"https://github.com/user/repo/pull/{hash(branch_name) % 100}"
+        # Simulate PR creation - crc32 is stable across interpreter runs,
+        # unlike hash() which is randomized by PYTHONHASHSEED
+        pr_url = f"https://github.com/user/repo/pull/{zlib.crc32(branch_name.encode()) % 100}"
         
         return {
             'success': True,
@@ -215,17 +395,43 @@ def coordinate_workflow(task_description: str) -> str:
     
     return f"Workflow coordination for: {task_description}\nSteps: {'; '.join(steps)}"
 
+def _record_interaction(workflow_results: Dict[str, Any], agent: str, action: str,
+                        response: str, results_ref: Optional[str] = None) -> None:
+    """Append one interaction to the columnar store, keeping columns aligned"""
+    interactions = workflow_results['agent_interactions']
+    interactions['agent'].append(agent)
+    interactions['action'].append(action)
+    interactions['response'].append(response)
+    interactions['results_ref'].append(results_ref)
+
 class StrandsCodeAnalyzer:
     """Main analyzer using Strands Agents for coordination"""
-    
+
+    # Agents are stateless, so all analyzer instances share one set built
+    # on first construction instead of five MockAgents per instance
+    _shared_agents = None
+
     def __init__(self):
         self.setup_agents()
-    
+
     def setup_agents(self):
-        """Initialize specialized Strands agents"""
-        
+        """Bind the shared Strands agents to this instance"""
+        agents = self._get_agents()
+        self.analysis_agent = agents['analysis']
+        self.fix_agent = agents['fix']
+        self.testing_agent = agents['testing']
+        self.pr_agent = agents['pr']
+        self.coordinator = agents['coordinator']
+
+    @classmethod
+    def _get_agents(cls):
+        """Initialize specialized Strands agents once per process"""
+
+        if cls._shared_agents is not None:
+            return cls._shared_agents
+
         # Analysis Agent - Focuses on code quality assessment
-        self.analysis_agent = MockAgent(
+        analysis_agent = MockAgent(
             name="analysis_agent",
             system_prompt="""
             You are a code analysis specialist. Your role is to:
@@ -240,7 +446,7 @@ class StrandsCodeAnalyzer:
         )
         
         # Fix Agent - Generates and applies code fixes
-        self.fix_agent = MockAgent(
+        fix_agent = MockAgent(
             name="fix_agent", 
             system_prompt="""
             You are a code improvement specialist. Your role is to:
@@ -255,7 +461,7 @@ class StrandsCodeAnalyzer:
         )
         
         # Testing Agent - Validates fixes and ensures quality
-        self.testing_agent = MockAgent(
+        testing_agent = MockAgent(
             name="testing_agent",
             system_prompt="""
             You are a quality assurance specialist. Your role is to:
@@ -270,7 +476,7 @@ class StrandsCodeAnalyzer:
         )
         
         # PR Agent - Manages Git operations and pull requests
-        self.pr_agent = MockAgent(
+        pr_agent = MockAgent(
             name="pr_agent",
             system_prompt="""
             You are a Git workflow specialist. Your role is to:
@@ -285,7 +491,7 @@ class StrandsCodeAnalyzer:
         )
         
         # Coordinator Agent - Orchestrates the entire workflow
-        self.coordinator = MockAgent(
+        coordinator = MockAgent(
             name="coordinator",
             system_prompt="""
             You are the workflow coordinator. Your role is to:
@@ -298,84 +504,96 @@ class StrandsCodeAnalyzer:
             """,
             tools=[coordinate_workflow]
         )
-    
-    def analyze_with_agents(self, file_path: str) -> Dict[str, Any]:
-        """Run coordinated analysis using Strands agents"""
-        
+
+        cls._shared_agents = {
+            'analysis': analysis_agent,
+            'fix': fix_agent,
+            'testing': testing_agent,
+            'pr': pr_agent,
+            'coordinator': coordinator
+        }
+        return cls._shared_agents
+
+    async def analyze_with_agents(self, file_path: str,
+                                   results_path: Optional[str] = None) -> Dict[str, Any]:
+        """Run coordinated analysis using Strands agents
+
+        Independent agent stages are fanned out with asyncio.gather so
+        workflow latency approaches max-of-stages instead of sum-of-stages.
+        When results_path is given, a partial snapshot is serialized there
+        while the PR step runs; the caller is expected to overwrite it with
+        the final dump and call flush_artifact_writes().
+        """
+
         print(f"🤖 Strands Multi-Agent Code Analysis")
         print(f"📁 File: {file_path}")
-        
-        # Read file content
+
+        # Read file content - mmap decodes straight from the page cache,
+        # skipping the intermediate read buffer on large files
         try:
-            with open(file_path, 'r') as f:
-                file_content = f.read()
+            with open(file_path, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        file_content = str(mm, 'utf-8')
+                except ValueError:
+                    # Empty files cannot be mapped
+                    file_content = f.read().decode('utf-8')
         except Exception as e:
             return {"error": f"Could not read file: {e}"}
-        
+
+        # Interactions are stored column-wise (parallel lists per field)
+        # instead of a list of per-step dicts - the JSON report stores each
+        # key once and the encoder walks four flat lists
         workflow_results = {
             'file_path': file_path,
-            'agent_interactions': [],
+            'agent_interactions': {
+                'agent': [],
+                'action': [],
+                'response': [],
+                'results_ref': []
+            },
             'final_results': {}
         }
-        
-        # Step 1: Coordinator initiates workflow
-        print(f"\n🎯 Step 1: Workflow Coordination")
-        coord_response = self.coordinator(f"Coordinate code analysis workflow for {file_path}")
-        workflow_results['agent_interactions'].append({
-            'agent': 'coordinator',
-            'action': 'initiate_workflow',
-            'response': coord_response
-        })
+
+        # Steps 1+2: coordination and quality analysis are independent -
+        # run them concurrently
+        print(f"\n🎯 Step 1+2: Workflow Coordination & Code Quality Analysis")
+        coord_response, analysis_response = await asyncio.gather(
+            asyncio.to_thread(self.coordinator, f"Coordinate code analysis workflow for {file_path}"),
+            asyncio.to_thread(self.analysis_agent, f"Analyze code quality for: {file_content[:200]}...")
+        )
+        _record_interaction(workflow_results, 'coordinator', 'initiate_workflow', coord_response)
         print(f"   {coord_response}")
-        
-        # Step 2: Analysis Agent performs quality assessment
-        print(f"\n📊 Step 2: Code Quality Analysis")
-        analysis_response = self.analysis_agent(f"Analyze code quality for: {file_content[:200]}...")
-        
+
         # Extract analysis results using the tool
         analysis_results = analyze_code_quality(file_content)
-        workflow_results['agent_interactions'].append({
-            'agent': 'analysis_agent',
-            'action': 'quality_analysis',
-            'response': analysis_response,
-            'results': analysis_results
-        })
+        _record_interaction(workflow_results, 'analysis_agent', 'quality_analysis', analysis_response, 'analysis')
         
         print(f"   Quality Score: {analysis_results['quality_score']}/10")
         print(f"   Issues Found: {analysis_results['total_issues']}")
         
         # Step 3: Fix Agent generates improvements
         print(f"\n🛠️  Step 3: Fix Generation")
-        fix_response = self.fix_agent(f"Generate fixes for {analysis_results['total_issues']} issues")
-        
+        fix_response = await asyncio.to_thread(
+            self.fix_agent, f"Generate fixes for {analysis_results['total_issues']} issues")
+
         fix_results = generate_code_fixes(file_content, analysis_results['issues'])
-        workflow_results['agent_interactions'].append({
-            'agent': 'fix_agent',
-            'action': 'generate_fixes',
-            'response': fix_response,
-            'results': fix_results
-        })
+        _record_interaction(workflow_results, 'fix_agent', 'generate_fixes', fix_response, 'fixes')
         
         print(f"   Fixes Generated: {fix_results['fixes_applied']}")
         print(f"   Improvement: {fix_results['improvement_estimate']}")
         
         # Step 4: Testing Agent validates fixes
         print(f"\n🧪 Step 4: Fix Validation")
+
+        # Agent commentary and the actual test run are independent; the
+        # fixed content is validated in memory - no temp file round trip
+        test_response, test_results = await asyncio.gather(
+            asyncio.to_thread(self.testing_agent, f"Validate fixes for {file_path}"),
+            asyncio.to_thread(run_tests, '<fixed>', fix_results['fixed_content'])
+        )
         
-        # Create temporary file with fixes
-        temp_file = file_path.replace('.py', '_fixed_temp.py')
-        with open(temp_file, 'w') as f:
-            f.write(fix_results['fixed_content'])
-        
-        test_response = self.testing_agent(f"Validate fixes in {temp_file}")
-        test_results = run_tests(temp_file)
-        
-        workflow_results['agent_interactions'].append({
-            'agent': 'testing_agent',
-            'action': 'validate_fixes',
-            'response': test_response,
-            'results': test_results
-        })
+        _record_interaction(workflow_results, 'testing_agent', 'validate_fixes', test_response, 'testing')
         
         print(f"   Test Status: {test_results['overall_status']}")
         print(f"   Syntax Check: {'✅' if test_results['syntax_check'] else '❌'}")
@@ -383,39 +601,43 @@ class StrandsCodeAnalyzer:
         # Step 5: PR Agent handles Git workflow (if tests pass)
         if test_results['overall_status'] == 'passed':
             print(f"\n🌿 Step 5: Pull Request Creation")
-            
+
+            if results_path is not None:
+                # Serialize the steps finished so far while the PR call
+                # runs; the final dump overwrites this partial snapshot
+                snapshot = {
+                    'file_path': file_path,
+                    'agent_interactions': {k: list(v) for k, v in workflow_results['agent_interactions'].items()},
+                    'final_results': {
+                        'analysis': analysis_results,
+                        'fixes': fix_results,
+                        'testing': test_results
+                    }
+                }
+                submit_artifact_write(lambda: _dump_results(snapshot, results_path))
+
             branch_name = f"strands-auto-fix-{Path(file_path).stem}"
             pr_title = f"Strands Auto-fix: {fix_results['fixes_applied']} improvements"
             pr_description = f"Automated fixes generated by Strands Agents:\n"
             for fix in fix_results['fixes'][:3]:
                 pr_description += f"- {fix['issue']}: {fix['explanation']}\n"
             
-            pr_response = self.pr_agent(f"Create PR: {pr_title}")
-            pr_results = create_pull_request(branch_name, pr_title, pr_description)
+            pr_response, pr_results = await asyncio.gather(
+                asyncio.to_thread(self.pr_agent, f"Create PR: {pr_title}"),
+                asyncio.to_thread(create_pull_request, branch_name, pr_title, pr_description)
+            )
             
-            workflow_results['agent_interactions'].append({
-                'agent': 'pr_agent',
-                'action': 'create_pull_request',
-                'response': pr_response,
-                'results': pr_results
-            })
+            _record_interaction(workflow_results, 'pr_agent', 'create_pull_request',
+                                pr_response, 'pr_creation')
             
             print(f"   PR Status: {'✅' if pr_results['success'] else '❌'}")
             if pr_results['success']:
                 print(f"   PR URL: {pr_results['pr_url']}")
         
-        # Clean up temp file
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-        
         # Final coordination summary
         print(f"\n📋 Step 6: Workflow Summary")
-        summary_response = self.coordinator("Provide workflow completion summary")
-        workflow_results['agent_interactions'].append({
-            'agent': 'coordinator',
-            'action': 'workflow_summary',
-            'response': summary_response
-        })
+        summary_response = await asyncio.to_thread(self.coordinator, "Provide workflow completion summary")
+        _record_interaction(workflow_results, 'coordinator', 'workflow_summary', summary_response)
         
         # Compile final results
         workflow_results['final_results'] = {
@@ -428,22 +650,54 @@ class StrandsCodeAnalyzer:
         
         return workflow_results
     
+    async def run_batch(self, file_paths: List[str], max_parallel_agents: int = 4,
+                        fail_fast: bool = False) -> List[Any]:
+        """Run the agent workflow over multiple files concurrently
+
+        Per-file pipelines are fully independent, so they fan out under a
+        semaphore. With fail_fast=False a failing file yields its exception
+        in the results list instead of cancelling the batch.
+        """
+
+        sem = asyncio.Semaphore(max(1, max_parallel_agents))
+
+        async def one(path):
+            async with sem:
+                return await self.analyze_with_agents(path)
+
+        return await asyncio.gather(*[one(p) for p in file_paths],
+                                    return_exceptions=not fail_fast)
+
     def get_agent_summary(self, results: Dict[str, Any]) -> str:
         """Generate summary of agent interactions"""
         
-        summary = "# Strands Multi-Agent Analysis Summary\n\n"
-        
-        for interaction in results['agent_interactions']:
-            agent_name = interaction['agent'].replace('_', ' ').title()
-            action = interaction['action'].replace('_', ' ').title()
-            
-            summary += f"## {agent_name} - {action}\n"
-            summary += f"Response: {interaction['response']}\n\n"
-            
-            if 'results' in interaction:
-                summary += f"Results: {json.dumps(interaction['results'], indent=2)}\n\n"
-        
-        return summary
+        # Collect parts and join once - repeated += reallocates the whole
+        # summary on every append
+        parts = [
+            "# Strands Multi-Agent Analysis Summary\n\n",
+            "_Interactions in strands_analysis_results.json are stored "
+            "column-wise (parallel agent/action/response/results_ref lists); "
+            "results_ref points into final_results._\n\n"
+        ]
+        final_results = results.get('final_results', {})
+
+        interactions = results['agent_interactions']
+        for agent, action, response, ref in zip(
+            interactions['agent'], interactions['action'],
+            interactions['response'], interactions['results_ref']
+        ):
+            agent_name = agent.replace('_', ' ').title()
+            action_name = action.replace('_', ' ').title()
+
+            parts.append(f"## {agent_name} - {action_name}\n")
+            parts.append(f"Response: {response}\n\n")
+
+            # Result payloads live once in final_results; interactions only
+            # carry a reference, so the summary doesn't duplicate them
+            if ref and final_results.get(ref) is not None:
+                parts.append(f"Results: stored in final_results['{ref}']\n\n")
+
+        return ''.join(parts)
 
 def main():
     """Demo Strands-powered code analysis"""
@@ -492,18 +746,21 @@ if __name__ == "__main__":
         analyzer = StrandsCodeAnalyzer()
         
         # Run coordinated analysis
-        results = analyzer.analyze_with_agents(sample_file)
+        results = asyncio.run(analyzer.analyze_with_agents(
+            sample_file, results_path="strands_analysis_results.json"))
         
         # Generate summary report
         summary = analyzer.get_agent_summary(results)
         
-        # Save results
-        with open("strands_analysis_results.json", 'w') as f:
-            json.dump(results, f, indent=2)
-        
-        with open("strands_analysis_summary.md", 'w') as f:
-            f.write(summary)
-        
+        # Save results on the writer thread and wait for both files
+        def _write_summary(text=summary):
+            with open("strands_analysis_summary.md", 'w') as f:
+                f.write(text)
+
+        submit_artifact_write(lambda: _dump_results(results, "strands_analysis_results.json"))
+        submit_artifact_write(_write_summary)
+        flush_artifact_writes()
+
         # Print final status
         final = results['final_results']
         print(f"\n🎯 Final Results:")
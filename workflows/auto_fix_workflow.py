@@ -1,73 +1,143 @@
 """Auto-fix workflow implementation"""
 
-from typing import Dict, Any
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from core.config import Config
 from core.base import AnalysisResult
 from core.exceptions import AnalysisError, FixGenerationError
+from core.workflow_dag import WorkflowDAG, file_stat_key, shared_state
+from .workflow_manager import _config_key
 from analyzers.unified_analyzer import UnifiedAnalyzer
 
+def _execute_one(config_dict: Dict[str, Any], file_path: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point - rebuilds the workflow inside the subprocess"""
+    workflow = AutoFixWorkflow(Config.from_dict(config_dict))
+    return workflow.execute(file_path, **kwargs)
+
 class AutoFixWorkflow:
     """Auto-fix workflow implementation"""
-    
+
     def __init__(self, config: Config):
         self.config = config
-        self.analyzer = UnifiedAnalyzer(config.to_dict())
-    
+        self.analyzer = UnifiedAnalyzer(config.as_dict)
+        self.dag = self._build_dag()
+
+    def _build_dag(self) -> WorkflowDAG:
+        """Wire the workflow stages; the analysis node is memoized in the
+        shared state so reruns on an unchanged file skip it"""
+        dag = WorkflowDAG(shared_state)
+        dag.add_node('analyze', self._node_analyze, memo_key=self._analysis_memo_key)
+        dag.add_node('generate_fixes', self._node_generate_fixes)
+        dag.add_node('apply_fixes', self._node_apply_fixes)
+        dag.add_node('create_pr', self._node_create_pr)
+        dag.add_edge('analyze', 'generate_fixes')
+        dag.add_edge('generate_fixes', 'apply_fixes')
+        dag.add_edge('apply_fixes', 'create_pr')
+        return dag
+
     def execute(self, file_path: str, **kwargs) -> Dict[str, Any]:
         """Execute auto-fix workflow"""
-        
+
         try:
-            # Step 1: Analyze
-            analysis = self.analyzer.analyze_file(file_path)
-            
-            if not analysis.issues:
-                return {
-                    'success': True,
-                    'message': 'No issues found to fix',
-                    'analysis': self._format_analysis(analysis)
-                }
-            
-            # Step 2: Generate fixes (simplified for now)
-            fixes = self._generate_fixes(analysis)
-            
-            # Step 3: Apply fixes if not dry run
-            if not kwargs.get('dry_run', False):
-                fixed_file = self._apply_fixes(file_path, fixes)
-                
-                # Step 4: Create PR if requested
-                if kwargs.get('create_pr', False):
-                    pr_url = self._create_pull_request(file_path, fixes)
-                    return {
-                        'success': True,
-                        'pr_url': pr_url,
-                        'fixes_applied': len(fixes),
-                        'analysis': self._format_analysis(analysis)
-                    }
-            
+            context = {'file_path': file_path, 'kwargs': kwargs, 'result': None}
+            self.dag.run(context)
+
+            if context['result'] is not None:
+                return context['result']
+
             return {
                 'success': True,
-                'fixes_available': len(fixes),
+                'fixes_available': len(context['generate_fixes']),
                 'dry_run': kwargs.get('dry_run', False),
-                'analysis': self._format_analysis(analysis)
+                'analysis': self._format_analysis(context['analyze'])
             }
-            
+
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
-    
+
+    def execute_batch(self, file_paths: List[str], max_workers: Optional[int] = None,
+                      **kwargs) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Execute over many independent files in parallel processes
+
+        Per-file analysis is CPU-bound, so a process pool scales with
+        cores. Yields (file_path, result) pairs as files complete; the
+        workflow is rebuilt from its config inside each worker since the
+        analyzer itself isn't shared across processes.
+        """
+        config_dict = self.config.as_dict
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            futures = {pool.submit(_execute_one, config_dict, path, kwargs): path
+                       for path in file_paths}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _analysis_memo_key(self, context: Dict[str, Any]) -> tuple:
+        """Scope the shared analysis memo by config as well as file
+        identity - analyzers with different configs produce different
+        results for the same file"""
+        return (_config_key(self.config.as_dict),) + file_stat_key(context)
+
+    def _node_analyze(self, context: Dict[str, Any]) -> AnalysisResult:
+        """Step 1: Analyze"""
+        return self.analyzer.analyze_file(context['file_path'])
+
+    def _node_generate_fixes(self, context: Dict[str, Any]) -> list:
+        """Step 2: Generate fixes (short-circuits when nothing to fix)"""
+        analysis = context['analyze']
+
+        if not analysis.issues:
+            # Clean files are the common case - skip the full analysis
+            # formatting and return just the identifying fields
+            context['done'] = True
+            context['result'] = {
+                'success': True,
+                'message': 'No issues found to fix',
+                'file_path': analysis.file_path,
+                'quality_score': analysis.quality_score
+            }
+            return []
+
+        return self._generate_fixes(analysis)
+
+    def _node_apply_fixes(self, context: Dict[str, Any]) -> Any:
+        """Step 3: Apply fixes if not dry run"""
+        if context['kwargs'].get('dry_run', False):
+            return None
+        return self._apply_fixes(context['file_path'], context['generate_fixes'])
+
+    def _node_create_pr(self, context: Dict[str, Any]) -> Any:
+        """Step 4: Create PR if requested"""
+        kwargs = context['kwargs']
+        if kwargs.get('dry_run', False) or not kwargs.get('create_pr', False):
+            return None
+
+        fixes = context['generate_fixes']
+        pr_url = self._create_pull_request(context['file_path'], fixes)
+        context['done'] = True
+        context['result'] = {
+            'success': True,
+            'pr_url': pr_url,
+            'fixes_applied': len(fixes),
+            'analysis': self._format_analysis(context['analyze'])
+        }
+        return pr_url
+
     def _format_analysis(self, analysis: AnalysisResult) -> Dict[str, Any]:
         """Format analysis for output"""
         return {
             'file_path': analysis.file_path,
             'language': analysis.language,
             'quality_score': analysis.quality_score,
-            'issues_found': len(analysis.issues),
+            'issues_found': analysis.issues_count,
             'issues': analysis.issues,
             'recommendations': analysis.recommendations
         }
-    
+
     def _generate_fixes(self, analysis: AnalysisResult) -> list:
         """Generate fixes for issues (simplified)"""
         fixes = []
@@ -79,13 +149,14 @@ class AutoFixWorkflow:
             }
             fixes.append(fix)
         return fixes
-    
+
     def _apply_fixes(self, file_path: str, fixes: list) -> str:
         """Apply fixes to file (simplified)"""
         # This would contain actual fix application logic
         return file_path + "_fixed"
-    
+
     def _create_pull_request(self, file_path: str, fixes: list) -> str:
         """Create pull request (simplified)"""
-        # This would contain actual PR creation logic
-        return f"https://github.com/user/repo/pull/{hash(file_path) % 100}"
+        # This would contain actual PR creation logic; crc32 keeps the
+        # simulated URL stable across interpreter runs
+        return f"https://github.com/user/repo/pull/{zlib.crc32(file_path.encode()) % 100}"
@@ -1,69 +1,115 @@
 """Strands workflow implementation"""
 
-from typing import Dict, Any
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from core.config import Config
+from core.workflow_dag import WorkflowDAG, file_stat_key, shared_state
+from .workflow_manager import _config_key
 from analyzers.unified_analyzer import UnifiedAnalyzer
 
+def _execute_one(config_dict: Dict[str, Any], file_path: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point - rebuilds the workflow inside the subprocess"""
+    workflow = StrandsWorkflow(Config.from_dict(config_dict))
+    return workflow.execute(file_path, **kwargs)
+
 class StrandsWorkflow:
     """Strands multi-agent workflow implementation"""
-    
+
     def __init__(self, config: Config):
         self.config = config
-        self.analyzer = UnifiedAnalyzer(config.to_dict())
-    
+        self.analyzer = UnifiedAnalyzer(config.as_dict)
+        self.dag = self._build_dag()
+
+    def _build_dag(self) -> WorkflowDAG:
+        """Wire the workflow stages; the analysis node shares its memoized
+        output with other workflows running on the same unchanged file"""
+        dag = WorkflowDAG(shared_state)
+        dag.add_node('analyze', self._node_analyze, memo_key=self._analysis_memo_key)
+        dag.add_node('coordinate', self._node_coordinate)
+        dag.add_edge('analyze', 'coordinate')
+        return dag
+
     def execute(self, file_path: str, **kwargs) -> Dict[str, Any]:
         """Execute Strands workflow"""
-        
+
         mode = kwargs.get('mode', 'coordinated')
-        
+
         try:
-            # Step 1: Multi-agent analysis
-            analysis = self.analyzer.analyze_file(file_path)
-            
-            # Step 2: Agent coordination (simplified)
-            coordination_result = self._coordinate_agents(analysis, mode)
-            
+            context = {'file_path': file_path, 'mode': mode}
+            self.dag.run(context)
+
+            coordination_result = context['coordinate']
+
             return {
                 'success': True,
                 'mode': mode,
                 'agents_used': coordination_result['agents'],
-                'analysis': self._format_analysis(analysis),
+                'analysis': self._format_analysis(context['analyze']),
                 'coordination': coordination_result
             }
-            
+
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
                 'mode': mode
             }
-    
+
+    def execute_batch(self, file_paths: List[str], max_workers: Optional[int] = None,
+                      **kwargs) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Execute over many independent files in parallel processes
+
+        Yields (file_path, result) pairs as files complete; the workflow
+        is rebuilt from its config inside each worker.
+        """
+        config_dict = self.config.as_dict
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            futures = {pool.submit(_execute_one, config_dict, path, kwargs): path
+                       for path in file_paths}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _analysis_memo_key(self, context: Dict[str, Any]) -> tuple:
+        """Scope the shared analysis memo by config as well as file
+        identity - analyzers with different configs produce different
+        results for the same file"""
+        return (_config_key(self.config.as_dict),) + file_stat_key(context)
+
+    def _node_analyze(self, context: Dict[str, Any]):
+        """Step 1: Multi-agent analysis"""
+        return self.analyzer.analyze_file(context['file_path'])
+
+    def _node_coordinate(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 2: Agent coordination (simplified)"""
+        return self._coordinate_agents(context['analyze'], context['mode'])
+
     def _coordinate_agents(self, analysis, mode: str) -> Dict[str, Any]:
         """Coordinate agents based on mode"""
-        
+
         agents_used = []
-        
+
         if mode in ['analysis', 'coordinated', 'full']:
             agents_used.extend(['coordinator', 'analysis_agent'])
-        
+
         if mode in ['coordinated', 'full']:
             agents_used.extend(['fix_agent', 'testing_agent'])
-        
+
         if mode == 'full':
             agents_used.append('pr_agent')
-        
+
         return {
             'agents': agents_used,
             'coordination_steps': len(agents_used),
             'workflow_completed': True
         }
-    
+
     def _format_analysis(self, analysis) -> Dict[str, Any]:
         """Format analysis for output"""
         return {
             'file_path': analysis.file_path,
             'language': analysis.language,
             'quality_score': analysis.quality_score,
-            'issues_found': len(analysis.issues),
+            'issues_found': analysis.issues_count,
             'recommendations': analysis.recommendations
         }
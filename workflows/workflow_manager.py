@@ -1,5 +1,13 @@
 """Workflow manager for orchestrating different analysis workflows"""
 
+import asyncio
+import copy
+import dataclasses
+import functools
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from enum import Enum
 from core.base import AnalysisResult
@@ -8,18 +16,142 @@ from core.config import Config
 from core.exceptions import AnalysisError
 from analyzers.unified_analyzer import UnifiedAnalyzer
 
+# Capability probes are stable for the process lifetime, so they are
+# memoized at module scope - only the first call per executable (or region)
+# pays the subprocess / client construction cost
+@functools.lru_cache(maxsize=None)
+def _git_available() -> bool:
+    # A PATH lookup answers "is it installed" without spawning `git --version`
+    return shutil.which('git') is not None
+
+@functools.lru_cache(maxsize=None)
+def _github_cli_available() -> bool:
+    return shutil.which('gh') is not None
+
+@functools.lru_cache(maxsize=None)
+def _aws_credentials_available(aws_region: str) -> bool:
+    # Resolving the credential chain is far cheaper than constructing a
+    # bedrock client (no service model load) and, unlike client
+    # construction, actually reports missing credentials
+    try:
+        import botocore.session
+        from botocore.exceptions import BotoCoreError
+    except ImportError:
+        return False
+
+    try:
+        session = botocore.session.Session()
+        session.set_config_variable('region', aws_region)
+        return session.get_credentials() is not None
+    except BotoCoreError:
+        return False
+
+# Workflow classes are imported lazily (they import this package's
+# analyzers) but only once - later calls are cache hits instead of
+# re-evaluating the import statement per file
+@functools.lru_cache(maxsize=None)
+def _get_auto_fix_cls():
+    from .auto_fix_workflow import AutoFixWorkflow
+    return AutoFixWorkflow
+
+@functools.lru_cache(maxsize=None)
+def _get_strands_cls():
+    from .strands_workflow import StrandsWorkflow
+    return StrandsWorkflow
+
+def _config_key(config_dict: Dict[str, Any]) -> frozenset:
+    """Hashable identity for a config dict (list values become tuples)"""
+    return frozenset(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in config_dict.items()
+    )
+
 class WorkflowType(Enum):
     """Available workflow types"""
     ANALYSIS_ONLY = "analysis_only"
     AUTO_FIX = "auto_fix"
     STRANDS_COORDINATED = "strands_coordinated"
 
+# Looked up once so the hot analysis path skips the enum attribute access
+_ANALYSIS_ONLY_VALUE = WorkflowType.ANALYSIS_ONLY.value
+
+# Enum .value resolved once per member so the error path avoids the
+# descriptor lookup per failure
+_TYPE_VALUES = MappingProxyType({wt: wt.value for wt in WorkflowType})
+
+# Pure constants, frozen at import time so info/requirement lookups stop
+# rebuilding identical nested structures per call. Keyed on the interned
+# .value strings - str hash/eq beats the enum comparison protocol
+_WORKFLOW_INFO = MappingProxyType({
+    'analysis_only': {
+        'name': 'Analysis Only',
+        'description': 'Comprehensive code analysis without fixes',
+        'features': ['Static analysis', 'LLM analysis', 'Quality scoring', 'Issue identification']
+    },
+    'auto_fix': {
+        'name': 'Auto-Fix',
+        'description': 'Complete workflow with automated fixes and PR creation',
+        'features': ['Analysis', 'Fix generation', 'Testing', 'PR creation']
+    },
+    'strands_coordinated': {
+        'name': 'Strands Coordinated',
+        'description': 'Multi-agent coordinated workflow',
+        'features': ['Agent coordination', 'Specialized analysis', 'Workflow orchestration']
+    }
+})
+
+_WORKFLOW_REQUIREMENTS = MappingProxyType({
+    'analysis_only': ('aws_credentials',),
+    'auto_fix': ('aws_credentials', 'git_available', 'github_cli'),
+    'strands_coordinated': ('aws_credentials', 'git_available')
+})
+
 class WorkflowManager:
     """Manages different workflow types and orchestrates execution"""
-    
+
+    # No per-instance __dict__ - managers are created per batch worker and
+    # only ever hold these three attributes
+    __slots__ = ('config', 'analyzer', '_dispatch', '_config_key')
+
+    # Completed ANALYSIS_ONLY results keyed by (config, path, mtime_ns,
+    # size) - the workflow is side-effect free, so reruns on an unchanged
+    # file are a lookup plus a defensive copy. AUTO_FIX/STRANDS mutate
+    # state and never hit this cache.
+    _analysis_cache: Dict[tuple, Dict[str, Any]] = {}
+    _ANALYSIS_CACHE_MAX = 512
+
+    # Shallow-copied per analysis call so the constant keys and values are
+    # allocated once at class load
+    _ANALYSIS_TEMPLATE = {
+        'success': True,
+        'workflow_type': _ANALYSIS_ONLY_VALUE,
+        'analysis': None
+    }
+
+    # Analyzers are pooled by config identity, so batch callers that build
+    # a manager per file construct one analyzer per unique config
+    _analyzer_pool: Dict[frozenset, UnifiedAnalyzer] = {}
+
     def __init__(self, config: Config = None):
         self.config = config or Config.from_env()
-        self.analyzer = UnifiedAnalyzer(self.config.to_dict())
+        config_dict = self.config.as_dict
+        key = _config_key(config_dict)
+        if key not in self._analyzer_pool:
+            self._analyzer_pool[key] = UnifiedAnalyzer(config_dict)
+        self.analyzer = self._analyzer_pool[key]
+        self._config_key = key
+
+        # Dispatch table built once per instance - execute_workflow resolves
+        # the handler with a single dict lookup
+        self._dispatch = {
+            WorkflowType.ANALYSIS_ONLY: self._execute_analysis_workflow,
+            WorkflowType.AUTO_FIX: self._execute_auto_fix_workflow,
+            WorkflowType.STRANDS_COORDINATED: self._execute_strands_workflow
+        }
+
+    @classmethod
+    def clear_pool(cls) -> None:
+        """Drop pooled analyzers (mainly for tests)"""
+        cls._analyzer_pool.clear()
     
     def execute_workflow(self, 
                         file_path: str, 
@@ -28,115 +160,133 @@ class WorkflowManager:
         """Execute specified workflow type"""
         
         try:
-            if workflow_type == WorkflowType.ANALYSIS_ONLY:
-                return self._execute_analysis_workflow(file_path, **kwargs)
-            elif workflow_type == WorkflowType.AUTO_FIX:
-                return self._execute_auto_fix_workflow(file_path, **kwargs)
-            elif workflow_type == WorkflowType.STRANDS_COORDINATED:
-                return self._execute_strands_workflow(file_path, **kwargs)
-            else:
+            handler = self._dispatch.get(workflow_type)
+            if handler is None:
                 raise ValueError(f"Unknown workflow type: {workflow_type}")
+
+            if workflow_type is WorkflowType.ANALYSIS_ONLY:
+                stat = os.stat(file_path)
+                key = (self._config_key, file_path, stat.st_mtime_ns, stat.st_size)
+                cached = self._analysis_cache.get(key)
+                if cached is None:
+                    cached = handler(file_path, **kwargs)
+                    self._analysis_cache[key] = cached
+                    while len(self._analysis_cache) > self._ANALYSIS_CACHE_MAX:
+                        del self._analysis_cache[next(iter(self._analysis_cache))]
+                # Copy so callers mutating the result don't poison the cache
+                return copy.deepcopy(cached)
+
+            return handler(file_path, **kwargs)
                 
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
-                'workflow_type': workflow_type.value
+                'workflow_type': _TYPE_VALUES.get(workflow_type, str(workflow_type))
             }
     
+    async def execute_workflow_async(self, file_path: str, workflow_type: WorkflowType,
+                                     **kwargs) -> Dict[str, Any]:
+        """Async entry point for callers on an event loop
+
+        The AUTO_FIX stages themselves already run as a WorkflowDAG inside
+        AutoFixWorkflow; this wrapper keeps the whole workflow off the
+        event loop so agent pipelines can overlap it with other work.
+        """
+        return await asyncio.to_thread(self.execute_workflow, file_path, workflow_type, **kwargs)
+
+    def execute_workflow_batch(self, file_paths: list, workflow_type: WorkflowType,
+                               max_workers: Optional[int] = None, **kwargs) -> Dict[str, Dict[str, Any]]:
+        """Execute a workflow over many independent files in parallel
+
+        The heavy stages are I/O-bound (Bedrock calls, subprocess-based
+        static analysis), so threads overlap them and the pooled analyzer
+        is shared across workers. Returns {file_path: result}.
+        """
+        if not file_paths:
+            return {}
+
+        workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {path: pool.submit(self.execute_workflow, path, workflow_type, **kwargs)
+                       for path in file_paths}
+            return {path: future.result() for path, future in futures.items()}
+
     def _execute_analysis_workflow(self, file_path: str, **kwargs) -> Dict[str, Any]:
         """Execute analysis-only workflow"""
         
         analysis_result = self.analyzer.analyze_file(file_path)
         
-        return {
-            'success': True,
-            'workflow_type': WorkflowType.ANALYSIS_ONLY.value,
-            'analysis': {
-                'file_path': analysis_result.file_path,
-                'language': analysis_result.language,
-                'quality_score': analysis_result.quality_score,
-                'issues_found': len(analysis_result.issues),
-                'issues': analysis_result.issues,
-                'recommendations': analysis_result.recommendations,
-                'metadata': analysis_result.metadata
-            }
+        # asdict mirrors every AnalysisResult field without the per-field
+        # copy boilerplate, so new fields flow through automatically
+        result = self._ANALYSIS_TEMPLATE.copy()
+        result['analysis'] = {
+            **dataclasses.asdict(analysis_result),
+            'issues_found': analysis_result.issues_count
         }
+        return result
     
     def _execute_auto_fix_workflow(self, file_path: str, **kwargs) -> Dict[str, Any]:
         """Execute auto-fix workflow"""
-        # Import here to avoid circular imports
-        from .auto_fix_workflow import AutoFixWorkflow
-        
-        auto_fix = AutoFixWorkflow(self.config)
+        auto_fix = _get_auto_fix_cls()(self.config)
         return auto_fix.execute(file_path, **kwargs)
     
     def _execute_strands_workflow(self, file_path: str, **kwargs) -> Dict[str, Any]:
         """Execute Strands coordinated workflow"""
-        # Import here to avoid circular imports
-        from .strands_workflow import StrandsWorkflow
-        
-        strands = StrandsWorkflow(self.config)
+        strands = _get_strands_cls()(self.config)
         return strands.execute(file_path, **kwargs)
     
     def get_workflow_info(self, workflow_type: WorkflowType) -> Dict[str, Any]:
         """Get information about a workflow type"""
-        
-        workflow_info = {
-            WorkflowType.ANALYSIS_ONLY: {
-                'name': 'Analysis Only',
-                'description': 'Comprehensive code analysis without fixes',
-                'features': ['Static analysis', 'LLM analysis', 'Quality scoring', 'Issue identification']
-            },
-            WorkflowType.AUTO_FIX: {
-                'name': 'Auto-Fix',
-                'description': 'Complete workflow with automated fixes and PR creation',
-                'features': ['Analysis', 'Fix generation', 'Testing', 'PR creation']
-            },
-            WorkflowType.STRANDS_COORDINATED: {
-                'name': 'Strands Coordinated',
-                'description': 'Multi-agent coordinated workflow',
-                'features': ['Agent coordination', 'Specialized analysis', 'Workflow orchestration']
-            }
-        }
-        
-        return workflow_info.get(workflow_type, {})
+        info = _WORKFLOW_INFO.get(workflow_type.value)
+        if info is None:
+            return {}
+        # Copy so callers mutating their result don't poison the shared table
+        return {**info, 'features': list(info['features'])}
     
-    def validate_workflow_requirements(self, workflow_type: WorkflowType) -> Dict[str, bool]:
-        """Validate requirements for workflow type"""
-        
-        requirements = {
-            'aws_credentials': self._check_aws_credentials(),
-            'git_available': self._check_git_available(),
-            'github_cli': self._check_github_cli()
-        }
+    def validate_workflow_requirements(self, workflow_type: WorkflowType,
+                                       fail_fast: bool = False) -> Dict[str, bool]:
+        """Validate requirements for workflow type
+
+        With fail_fast=True the checks run in declared order and stop at
+        the first failure, so a misconfigured environment skips the
+        remaining probes; the returned dict then only covers the checks
+        that ran.
+        """
         
-        workflow_requirements = {
-            WorkflowType.ANALYSIS_ONLY: ['aws_credentials'],
-            WorkflowType.AUTO_FIX: ['aws_credentials', 'git_available', 'github_cli'],
-            WorkflowType.STRANDS_COORDINATED: ['aws_credentials', 'git_available']
+        checks = {
+            'aws_credentials': self._check_aws_credentials,
+            'git_available': self._check_git_available,
+            'github_cli': self._check_github_cli
         }
         
-        needed = workflow_requirements.get(workflow_type, [])
-        return {req: requirements[req] for req in needed}
+        needed = _WORKFLOW_REQUIREMENTS.get(workflow_type.value, ())
+        if not needed:
+            return {}
+
+        if fail_fast:
+            results = {}
+            for req in needed:
+                results[req] = checks[req]()
+                if not results[req]:
+                    break
+            return results
+
+        # The probes are independent and I/O-bound, and only the ones this
+        # workflow needs are submitted - wall time is the slowest probe
+        # instead of their sum
+        with ThreadPoolExecutor(max_workers=len(needed)) as pool:
+            futures = {req: pool.submit(checks[req]) for req in needed}
+            return {req: future.result() for req, future in futures.items()}
     
     def _check_aws_credentials(self) -> bool:
         """Check if AWS credentials are available"""
-        try:
-            import boto3
-            boto3.client('bedrock-runtime', region_name=self.config.aws_region)
-            return True
-        except:
-            return False
+        return _aws_credentials_available(self.config.aws_region)
     
     def _check_git_available(self) -> bool:
         """Check if Git is available"""
-        from core.utils import ProcessUtils
-        result = ProcessUtils.run_command(['git', '--version'])
-        return result['success']
+        return _git_available()
     
     def _check_github_cli(self) -> bool:
         """Check if GitHub CLI is available"""
-        from core.utils import ProcessUtils
-        result = ProcessUtils.run_command(['gh', '--version'])
-        return result['success']
+        return _github_cli_available()